@@ -69,6 +69,11 @@ class NetCDFDatabaseBackend(BaseDatabaseBackend):
         if any([level.endswith(".") for level in levels.values()]):
             raise ValueError("Metadata cannot end in a '.'")
 
+        # '[' and '?' are glob wildcards so data saved with them could never
+        # be found again by load
+        if any([c in level for level in levels.values() for c in "[?"]):
+            raise ValueError("Metadata cannot contain '[' or '?'")
+
         return self._get_out_filepath(**levels)
 
     def _get_out_filepath(self, **data_levels):
@@ -4,9 +4,12 @@ Helpers for filtering data in :class:`scmdata.run.ScmRun`.
 Based upon :mod:`pyam.utils`.
 """
 
+import calendar
 import datetime
+import functools
 import re
 import time
+from collections import OrderedDict
 from typing import Any, Iterable, List, Optional, Union
 
 import numpy as np
@@ -16,6 +19,144 @@ from scmdata._typing import MetadataValue
 
 HIERARCHY_SEPARATOR = "|"
 
+_TIME_NAME_LOOKUPS = {
+    "tm_mon": {
+        m.lower(): i
+        for names in (calendar.month_abbr, calendar.month_name)
+        for i, m in enumerate(names)
+        if m
+    },
+    "tm_wday": {
+        d.lower(): i
+        for names in (calendar.day_abbr, calendar.day_name)
+        for i, d in enumerate(names)
+    },
+}
+"""Static month/day name lookups, equivalent to :func:`time.strptime` results"""
+
+_ESCAPE_TABLE = str.maketrans(
+    {
+        "|": r"\|",
+        ".": r"\.",
+        "+": r"\+",
+        "(": r"\(",
+        ")": r"\)",
+        "$": r"\$",
+        "^": r"\^",
+    }
+)
+"""Translation table which escapes regexp special characters in filter values"""
+
+
+def _pattern_source(s: str, regexp: bool) -> str:
+    """
+    Convert a filter value into regular expression source.
+
+    Parameters
+    ----------
+    s
+        Filter value to convert
+
+    regexp
+        If ``True``, treat :obj:`s` as a regexp directly rather than using our
+        pseudo regexp syntax (in which ``"*"`` is the only special character).
+
+    Returns
+    -------
+    str
+        Regular expression source which can be passed to :func:`re.compile`
+    """
+    if regexp:
+        return s
+
+    return s.translate(_ESCAPE_TABLE).replace("*", ".*") + "$"
+
+
+_CATEGORY_MASK_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_CATEGORY_MASK_CACHE_MAXSIZE = 256
+
+
+def _category_match_mask(
+    meta_col: pd.Index,
+    s: str,
+    regexp: bool,
+    level: Optional[Any] = None,
+    separator: str = HIERARCHY_SEPARATOR,
+) -> np.ndarray:
+    """
+    Category-level boolean mask of the categories matching a filter value.
+
+    The masks are memoized per categories object so that repeating the same
+    filter against an unmodified column skips the category scan entirely.
+    Mutating a column always builds a new categorical, so a stale entry can
+    never be returned; stale entries are evicted LRU-style.
+
+    Parameters
+    ----------
+    meta_col
+        Categorical column being filtered
+
+    s
+        Filter value
+
+    regexp
+        Passed to :func:`_compile_scm_pattern`
+
+    level
+        If not ``None``, also require the depth match from :func:`find_depth`
+
+    separator
+        Passed to :func:`find_depth`
+
+    Returns
+    -------
+    :class:`numpy.ndarray` of :obj:`bool`
+        Array with one element per category where ``True`` indicates a match
+    """
+    categories = meta_col.categories
+    key = (id(categories), s, regexp, level, separator)
+
+    cached = _CATEGORY_MASK_CACHE.get(key)
+    if cached is not None and cached[0] is categories:
+        _CATEGORY_MASK_CACHE.move_to_end(key)
+        return cached[1]
+
+    mask = np.asarray(
+        categories.astype(str).str.match(_compile_scm_pattern(s, regexp))
+    )
+    if level is not None:
+        mask = mask & find_depth(meta_col, s, level, separator=separator)
+
+    _CATEGORY_MASK_CACHE[key] = (categories, mask)
+    if len(_CATEGORY_MASK_CACHE) > _CATEGORY_MASK_CACHE_MAXSIZE:
+        _CATEGORY_MASK_CACHE.popitem(last=False)
+
+    return mask
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_scm_pattern(s: str, regexp: bool) -> "re.Pattern[str]":
+    """
+    Compile a filter value into a regular expression.
+
+    The compiled patterns are cached so that repeated filters using the same
+    values do not pay the compilation cost again.
+
+    Parameters
+    ----------
+    s
+        Filter value to compile
+
+    regexp
+        Passed to :func:`_pattern_source`
+
+    Returns
+    -------
+    :class:`re.Pattern`
+        Compiled pattern
+    """
+    return re.compile(_pattern_source(s, regexp))
+
 
 def is_in(vals: Iterable[Any], items: Iterable[Any]) -> np.ndarray:
     """
@@ -36,7 +177,54 @@ def is_in(vals: Iterable[Any], items: Iterable[Any]) -> np.ndarray:
         Array of the same length as :obj:`vals` where the element is ``True`` if the
         corresponding element of :obj:`vals` is in :obj:`items` and False otherwise
     """
-    return np.array([v in items for v in vals])
+    items_arr = np.asarray(
+        items if isinstance(items, (list, tuple, np.ndarray)) else list(items)
+    )
+    vals_idx = pd.Index(vals)
+
+    if np.issubdtype(vals_idx.dtype, np.integer) and np.issubdtype(
+        items_arr.dtype, np.integer
+    ):
+        return _is_in_int(vals_idx.to_numpy(), items_arr)
+
+    if pd.api.types.is_numeric_dtype(vals_idx.dtype) and np.issubdtype(
+        items_arr.dtype, np.number
+    ):
+        return np.isin(vals_idx.to_numpy(), items_arr)
+
+    return np.asarray(vals_idx.isin(items_arr))
+
+
+_BITMAP_SPAN_LIMIT = 2**16
+"""Widest min-max range of items for which :func:`_is_in_int` uses a bitmap"""
+
+
+def _is_in_int(vals: np.ndarray, items: np.ndarray) -> np.ndarray:
+    """
+    Integer fast path for :func:`is_in`.
+
+    When the items span a small range (e.g. years or hours), membership is a
+    single gather through a dense boolean bitmap, which is considerably faster
+    than the general sort-based :func:`numpy.isin` algorithm.
+    """
+    if not len(items) or not len(vals):
+        return np.zeros(len(vals), dtype=bool)
+
+    lo = items.min()
+    span = items.max() - lo + 1
+    if span > _BITMAP_SPAN_LIMIT:
+        return np.isin(vals, items)
+
+    bitmap = np.zeros(span, dtype=bool)
+    bitmap[items - lo] = True
+
+    shifted = vals - lo
+    in_range = (shifted >= 0) & (shifted < span)
+
+    out = np.zeros(len(vals), dtype=bool)
+    out[in_range] = bitmap[shifted[in_range]]
+
+    return out
 
 
 def find_depth(
@@ -44,7 +232,7 @@ def find_depth(
     s: str,
     level: Union[int, str],
     separator: str = HIERARCHY_SEPARATOR,
-) -> List[Any]:
+) -> np.ndarray:
     """
     Find all values which match given depth from a filter keyword.
 
@@ -68,42 +256,34 @@ def find_depth(
     Returns
     -------
     :class:`numpy.ndarray` of :obj:`bool`
-        Array where ``True`` indicates a match
+        Array with one element per category of :obj:`meta_col` where ``True``
+        indicates a match
 
     Raises
     ------
     ValueError
         If :obj:`level` cannot be understood
     """
-    # determine function for finding depth level
-    if not isinstance(level, str):
-
-        def test(x):
-            return level == x
+    # determine depth of each category in a single vectorised pass
+    regexp = str(s).replace("*", "")
+    cats = pd.Index(meta_col.categories)
+    depths = (
+        cats.astype(str)
+        .str.replace(regexp, "", regex=False)
+        .str.count(re.escape(separator))
+        .to_numpy()
+    )
 
+    if not isinstance(level, str):
+        mask = depths == level
     elif level[-1] == "-":
-        _level = int(level[:-1])
-
-        def test(x):
-            return _level >= x
-
+        mask = depths <= int(level[:-1])
     elif level[-1] == "+":
-        _level = int(level[:-1])
-
-        def test(x):
-            return _level <= x
-
+        mask = depths >= int(level[:-1])
     else:
         raise ValueError(f"Unknown level type: {level}")
 
-    # determine depth
-    pipe = re.compile(re.escape(separator))
-    regexp = str(s).replace("*", "")
-
-    def apply_test(val):
-        return test(len(pipe.findall(val.replace(regexp, ""))))
-
-    return [m for m in meta_col.categories if apply_test(m)]
+    return mask
 
 
 def pattern_match(  # pylint: disable=too-many-arguments,too-many-locals
@@ -151,12 +331,21 @@ def pattern_match(  # pylint: disable=too-many-arguments,too-many-locals
         Filtering is performed on a string metadata column which contains
         :class:`numpy.nan` and :obj:`has_nan` is ``False``
     """
-    matches = np.array([False] * len(meta_col), dtype=bool)
-    _values: Iterable[Any] = (
-        [values]
-        if not isinstance(values, Iterable) or isinstance(values, str)
-        else values
-    )
+    # cheap scalar checks come first, the Iterable ABC check is comparatively
+    # slow so it is only used for values the fast paths cannot classify
+    if isinstance(values, (str, datetime.datetime)) or np.isscalar(values):
+        _values: List[Any] = [values]
+    elif isinstance(values, Iterable):
+        _values = list(values)
+    else:
+        _values = [values]
+
+    # a bare wildcard matches everything so no categories need to be touched
+    if level is None and not regexp and any(v == "*" for v in _values):
+        return np.ones(len(meta_col), dtype=bool)
+
+    string_values: List[str] = []
+    numeric_values: List[float] = []
 
     for s in _values:
         comparison_value: str | float = s
@@ -169,39 +358,84 @@ def pattern_match(  # pylint: disable=too-many-arguments,too-many-locals
         )
 
         if use_string_comparison:
-            if not regexp and comparison_value == "*" and level is None:
-                matches |= True
-            else:
-                _regexp = (
-                    str(s)
-                    .replace("|", "\\|")
-                    .replace(".", r"\.")  # `.` has to be replaced before `*`
-                    .replace("*", ".*")
-                    .replace("+", r"\+")
-                    .replace("(", r"\(")
-                    .replace(")", r"\)")
-                    .replace("$", "\\$")
-                    .replace("^", "\\^")
-                ) + "$"
-                pattern = re.compile(_regexp if not regexp else str(comparison_value))
-
-                subset = [m for m in meta_col.categories if pattern.match(str(m))]
-
-                if level is not None:
-                    depth = find_depth(
-                        meta_col, str(comparison_value), level, separator=separator
-                    )
-                    subset = set(subset).intersection(set(depth))
-
-                matches |= meta_col.isin(subset)
+            string_values.append(str(s))
         else:
-            s_float = float(comparison_value)
-            if np.isnan(s_float):
-                matches |= [
-                    c == -1 for c in meta_col.codes
-                ]  # nan's are missing from categoricals
-            else:
-                matches |= np.isclose(s_float, meta_col.astype(float))
+            numeric_values.append(float(comparison_value))
+
+    matches = _match_string_values(
+        meta_col, string_values, regexp, level, separator
+    )
+    if numeric_values and not matches.all():
+        matches |= _match_numeric_values(meta_col, numeric_values)
+
+    return matches
+
+
+def _match_string_values(
+    meta_col: pd.Index,
+    values: List[str],
+    regexp: bool,
+    level: Optional[Any],
+    separator: str,
+) -> np.ndarray:
+    """
+    Row-level boolean mask of the rows matching the given string filter values
+    """
+    matches = np.array([False] * len(meta_col), dtype=bool)
+
+    if level is not None or regexp:
+        # depth-qualified values need their own depth intersection and
+        # user-supplied regexps cannot be combined without changing their
+        # meaning (inline flags must stay at the start of the expression and
+        # backreference numbering must be preserved), so these are matched
+        # one at a time
+        for s in values:
+            cat_mask = _category_match_mask(
+                meta_col, s, regexp, level=level, separator=separator
+            )
+            if len(cat_mask):
+                matches |= cat_mask[meta_col.codes] & (meta_col.codes != -1)
+            if matches.all():
+                break
+    elif values:
+        # one alternation scan over the categories matches all the pseudo
+        # regexp patterns at once
+        combined = "|".join(
+            f"(?:{_pattern_source(s, regexp)})" for s in values
+        )
+
+        cat_mask = _category_match_mask(meta_col, combined, True)
+        if len(cat_mask):
+            matches |= cat_mask[meta_col.codes] & (meta_col.codes != -1)
+
+    return matches
+
+
+def _match_numeric_values(meta_col: pd.Index, values: List[float]) -> np.ndarray:
+    """
+    Row-level boolean mask of the rows matching the given numeric filter values
+
+    nan matches the rows missing from the categorical.
+    """
+    matches = np.array([False] * len(meta_col), dtype=bool)
+
+    # float view of the categories, built on first use and shared across all
+    # numeric filter values
+    cat_floats: Optional[np.ndarray] = None
+
+    for s_float in values:
+        if np.isnan(s_float):
+            matches |= meta_col.codes == -1  # nan's are missing from categoricals
+            continue
+
+        if cat_floats is None:
+            cat_floats = meta_col.categories.to_numpy(dtype=float)
+
+        # compare against the short categories array, then gather the
+        # result per row via the integer codes
+        sub_mask = np.isclose(s_float, cat_floats)
+        if len(sub_mask):
+            matches |= sub_mask[meta_col.codes] & (meta_col.codes != -1)
 
     return matches
 
@@ -230,6 +464,12 @@ def years_match(
     TypeError
         If :obj:`years` is not :obj:`int` or list of :obj:`int`
     """
+    if isinstance(years, range) and years.step == 1:
+        # a contiguous range is an interval check so there is no need to
+        # materialise the range for a membership test
+        data = np.asarray(data)
+        return (data >= years.start) & (data < years.stop)
+
     years = [years] if isinstance(years, int) else years
     usable_int = (
         all(isinstance(y, (int, np.integer)) for y in years)
@@ -351,20 +591,30 @@ def time_match(
         "Jan-Feb"] instead)
     """
     times_list: List[Union[int, str]] = (
-        [times] if isinstance(times, (int, str)) else times
+        [times] if isinstance(times, (int, str)) else list(times)
     )
 
     def conv_strs(strs_to_convert, conv_codes, name):
         res = None
-        for conv_code in conv_codes:
+
+        # month and day names resolve via a static lookup, which is much
+        # cheaper than strptime's general format parsing
+        lookup = _TIME_NAME_LOOKUPS.get(strptime_attr)
+        if lookup is not None:
             try:
-                res = [
-                    getattr(time.strptime(t, conv_code), strptime_attr)
-                    for t in strs_to_convert
-                ]
-                break
-            except ValueError:
-                continue
+                res = [lookup[t.lower()] for t in strs_to_convert]
+            except KeyError:
+                res = None
+        else:
+            for conv_code in conv_codes:
+                try:
+                    res = [
+                        getattr(time.strptime(t, conv_code), strptime_attr)
+                        for t in strs_to_convert
+                    ]
+                    break
+                except ValueError:
+                    continue
 
         if res is None:
             error_msg = f"Could not convert {name} '{strs_to_convert}' to integer"
@@ -372,28 +622,33 @@ def time_match(
         return res
 
     if isinstance(times_list[0], str):
-        to_delete = []
-        to_append: List[Any] = []
-        for i, timeset in enumerate(times_list):
-            # ignore type as already established we're looking at strings
-            if "-" in timeset:  # type: ignore
-                ints = conv_strs(timeset.split("-"), conv_codes, name)  # type: ignore
-                if ints[0] > ints[1]:
+        # convert every string, including the endpoints of any "X-Y" ranges,
+        # in a single pass
+        split_times = [str(timeset).split("-") for timeset in times_list]
+        int_parts = conv_strs(
+            [part for parts in split_times for part in parts], conv_codes, name
+        )
+
+        converted: List[int] = []
+        pos = 0
+        for timeset, parts in zip(times_list, split_times):
+            if len(parts) > 1:
+                first, last = int_parts[pos], int_parts[pos + 1]
+                if first > last:
                     error_msg = (
                         "string ranges must lead to increasing integer ranges,"
-                        f" {timeset} becomes {ints}"
+                        f" {timeset} becomes {[first, last]}"
                     )
                     raise ValueError(error_msg)
 
                 # + 1 to include last month
-                to_append += [j for j in range(ints[0], ints[1] + 1)]
-                to_delete.append(i)
+                converted += [j for j in range(first, last + 1)]
+            else:
+                converted.append(int_parts[pos])
 
-        for i in to_delete:
-            del times_list[i]
+            pos += len(parts)
 
-        times_list = conv_strs(times_list, conv_codes, name)
-        times_list += to_append
+        times_list = converted
 
     return is_in(data, times_list)
 
@@ -13,7 +13,6 @@ from numpy.typing import NDArray
 from xarray.core import ops
 from xarray.core.common import ImplementsArrayReduce
 
-from scmdata._typing import MetadataValue
 from scmdata.run import BaseScmRun, GenericRun
 
 if TYPE_CHECKING:
@@ -45,48 +44,43 @@ class RunGroupBy(ImplementsArrayReduce, Generic[GenericRun]):
     ):
         self.run = run
         self.group_keys = groups
+        self.na_fill_value = float(na_fill_value)
+
+        # reuse the grouper from a previous groupby over the same columns if
+        # the meta has not changed since (any meta mutation builds a new
+        # MultiIndex so an identity check is sufficient)
+        cache_key = (tuple(groups), self.na_fill_value)
+        cached = run._grouper_cache.get(cache_key)
+        if cached is not None and cached[0] is run._meta:
+            self._grouper: DataFrameGroupBy = cached[1]
+            return
 
         m = run.meta.reset_index(drop=True)
-        self.na_fill_value = float(na_fill_value)
 
         # Work around the bad handling of NaN values in groupbys
-        if any([np.issubdtype(m[c].dtype, np.number) for c in m]):
-            if (m == na_fill_value).any(axis=None):
-                raise ValueError(
-                    "na_fill_value conflicts with data value. Choose a na_fill_value "
-                    "not in meta"
-                )
-            else:
+        numeric_cols = m.select_dtypes(include=np.number).columns
+        if len(numeric_cols):
+            # the fill value can only collide with numeric columns so the
+            # object/string columns don't need to be scanned
+            for c in numeric_cols:
+                if (m[c].to_numpy() == self.na_fill_value).any():
+                    raise ValueError(
+                        "na_fill_value conflicts with data value. Choose a "
+                        "na_fill_value not in meta"
+                    )
+
+            if m.isna().to_numpy().any():
                 m = m.fillna(na_fill_value)
 
-        self._grouper: DataFrameGroupBy = m.groupby(list(groups), group_keys=True)
+        self._grouper = m.groupby(list(groups), group_keys=True)
+        run._grouper_cache[cache_key] = (run._meta, self._grouper)
 
     def _iter_grouped(self) -> Iterator[GenericRun]:
-        def _try_fill_value(v: MetadataValue) -> MetadataValue:
-            try:
-                if float(v) == float(self.na_fill_value):
-                    return np.nan
-            except ValueError:
-                pass
-            return v
-
-        groups: Iterable[
-            MetadataValue | tuple[MetadataValue, ...]
-        ] = self._grouper.groups
-        for indices in groups:
-            if not isinstance(indices, Iterable) or isinstance(indices, str):
-                indices_clean: tuple[MetadataValue, ...] = (indices,)
-            else:
-                indices_clean = indices
-
-            indices_clean = tuple(_try_fill_value(v) for v in indices_clean)
-            filter_kwargs = {k: v for k, v in zip(self.group_keys, indices_clean)}
-            res = self.run.filter(**filter_kwargs)  # type: ignore
-            if not len(res):
-                raise ValueError(
-                    f"Empty group for {list(zip(self.group_keys, indices_clean))}"
-                )
-            yield res
+        # slice the run using the grouper's precomputed positions rather than
+        # re-filtering the whole run for every group
+        positions = self._grouper.indices
+        for name in self._grouper.groups:
+            yield self.run._from_iloc(positions[name])
 
     def __iter__(self) -> Iterator[GenericRun]:
         """
@@ -234,13 +228,15 @@ class RunGroupBy(ImplementsArrayReduce, Generic[GenericRun]):
         """
         Recombine the applied objects like the original.
         """
-        from scmdata.run import run_append
+        from scmdata.run import _fast_concat, run_append
 
         # Remove all None values
         applied_clean = [df for df in applied if df is not None]
 
         if len(applied_clean) == 0:
             return self.run.__class__()
+        elif all(isinstance(df, self.run.__class__) for df in applied_clean):
+            return _fast_concat(applied_clean)
         else:
             return run_append(applied_clean)
 
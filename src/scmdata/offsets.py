@@ -125,7 +125,15 @@ def generate_range(
         offset.rollback(start_cf), offset.rollforward(end_cf), freq=offset
     )
 
-    return [date_cls(*dt.timetuple()[:6]) for dt in res]
+    if date_cls is cftime.DatetimeGregorian:
+        # the range is already generated as Gregorian datetimes so there is
+        # nothing to convert
+        return res.tolist()
+
+    return [
+        date_cls(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second)
+        for dt in res
+    ]
 
 
 __all__ = ["to_offset", "generate_range"]
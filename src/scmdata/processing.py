@@ -18,6 +18,20 @@ def _get_ts_gt_threshold(scmrun, threshold):
     return timeseries > threshold
 
 
+def _extract_year(times):
+    """
+    Extract the year of each element of a series of times
+
+    Uses the vectorised datetime accessor where possible, falling back to a
+    per-element loop for times outside pandas' nanosecond-resolution bounds
+    (which are held as plain datetime objects).
+    """
+    if pd.api.types.is_datetime64_any_dtype(times):
+        return times.dt.year.astype(int)
+
+    return times.apply(lambda x: x.year).astype(int)
+
+
 def calculate_crossing_times(scmrun, threshold, return_year=True):
     """
     Calculate the time at which each timeseries crosses a given threshold
@@ -47,14 +61,22 @@ def calculate_crossing_times(scmrun, threshold, return_year=True):
     times on an annual resolution, interpolate (or resample) to annual data
     before calling ``calculate_crossing_times``.
     """
-    timeseries_gt_threshold = _get_ts_gt_threshold(scmrun, threshold)
-    out = timeseries_gt_threshold.idxmax(axis=1)
+    timeseries = scmrun.timeseries()
+    gt_threshold = timeseries.to_numpy() > threshold
+
+    # work on the underlying array so the compare, argmax and any reductions
+    # are single C-level passes rather than pandas row-wise operations
+    first_cross = gt_threshold.argmax(axis=1)
+    crossed = gt_threshold.any(axis=1)
 
+    out = pd.Series(timeseries.columns[first_cross], index=timeseries.index)
+    # the column labels carry the "time" name which idxmax would not
+    out.name = None
     if return_year:
-        out = out.apply(lambda x: x.year).astype(int)
+        out = _extract_year(out)
 
     # if don't cross, set to nan
-    out[~timeseries_gt_threshold.any(axis=1)] = np.nan
+    out[~crossed] = np.nan
 
     return out
 
@@ -174,19 +196,55 @@ def calculate_crossing_times_quantiles(
 
 
 def _assert_only_one_value(scmrun, col):
-    if len(scmrun.get_unique_meta(col)) > 1:
+    # only whether a second value exists matters so a single vectorised
+    # compare against the first value beats computing the full unique set
+    vals = scmrun[col].to_numpy()
+    if len(vals) and (vals != vals[0]).any():
         raise ValueError(
             f"More than one value for {col}. " "This is unlikely to be what you want."
         )
 
 
-def _get_exceedance_fraction(ts, group_cols):
-    grouper = ts.groupby(group_cols)
-    number_exceeding = grouper.sum()
-    number_members = grouper.count()
-    out = number_exceeding / number_members
+def _factorize_groups(index, group_cols):
+    """
+    Factorise the ``group_cols`` levels of ``index`` into integer group codes
 
-    return out
+    The codes and the index of unique group keys can be reused across several
+    reductions over the same grouping (e.g. one per threshold) so the group
+    enumeration only happens once.
+    """
+    if len(group_cols) > 1:
+        to_factorize = pd.MultiIndex.from_arrays(
+            [index.get_level_values(c) for c in group_cols]
+        )
+    else:
+        to_factorize = index.get_level_values(group_cols[0])
+
+    codes, groups = to_factorize.factorize(sort=True)
+    if isinstance(groups, pd.MultiIndex):
+        # MultiIndex.factorize assigns real codes to keys containing NaN,
+        # unlike the flat-Index path, so mark those rows with -1 and drop
+        # the groups to match groupby's dropna behaviour
+        nan_group = np.array(
+            [any(pd.isna(v) for v in key) for key in groups], dtype=bool
+        )
+        if nan_group.any():
+            remap = np.cumsum(~nan_group) - 1
+            remap[nan_group] = -1
+            codes = np.where(codes != -1, remap[codes], -1)
+            groups = groups[~nan_group]
+
+        groups.names = group_cols
+    else:
+        groups.name = group_cols[0]
+
+    return codes, groups
+
+
+def _get_exceedance_fraction(ts, group_cols):
+    # a single mean reduction over the boolean exceedances is equivalent to
+    # counting them and dividing by the group size, in one pass over the data
+    return ts.groupby(group_cols).mean()
 
 
 _DEFAULT_EXCEEDANCE_PROB_OUTPUT_BASE = "{} exceedance probability"
@@ -199,8 +257,43 @@ def _get_exceedance_prob_output_name(output_name, threshold):
     return output_name
 
 
+def _exceedance_probabilities_from_ts(ts, threshold, grouping, output_name=None):
+    # compare and reduce on the raw ndarray so the (n_ts, n_times) boolean
+    # intermediate never goes through pandas' block machinery
+    codes, groups = grouping
+    exceeded = np.any(ts.to_numpy() > threshold, axis=1)
+
+    # rows coded -1 (NaN group keys) are dropped, matching groupby's dropna
+    valid = codes >= 0
+    counts = np.bincount(codes[valid], minlength=len(groups))
+    number_exceeding = np.bincount(
+        codes[valid], weights=exceeded[valid], minlength=len(groups)
+    )
+    out = pd.Series(number_exceeding / counts, index=groups)
+
+    if not isinstance(out, pd.Series):  # pragma: no cover # emergency valve
+        raise AssertionError("How did we end up without a series?")  # noqa
+
+    out.name = _get_exceedance_prob_output_name(output_name, threshold)
+    out = _set_index_level_to(out, "unit", "dimensionless")
+
+    return out
+
+
 def _set_index_level_to(inp, col, val):
-    inp.index = inp.index.set_levels([val], level=col)
+    idx = inp.index
+    pos = idx.names.index(col)
+
+    # swap the level array in directly, skipping set_levels' rebuild and
+    # validation of the untouched levels
+    levels = list(idx.levels)
+    codes = list(idx.codes)
+    levels[pos] = pd.Index([val])
+    codes[pos] = np.zeros(len(idx), dtype=np.asarray(codes[pos]).dtype)
+
+    inp.index = pd.MultiIndex(
+        levels=levels, codes=codes, names=idx.names, verify_integrity=False
+    )
 
     return inp
 
@@ -248,23 +341,16 @@ def calculate_exceedance_probabilities(
     """
     _assert_only_one_value(scmrun, "variable")
     _assert_only_one_value(scmrun, "unit")
-    timeseries_gt_threshold = _get_ts_gt_threshold(scmrun, threshold)
     group_cols = list(scmrun.get_meta_columns_except(process_over_cols))
+    ts = scmrun.timeseries()
 
-    out = _get_exceedance_fraction(
-        timeseries_gt_threshold.any(axis=1),
-        group_cols,
+    return _exceedance_probabilities_from_ts(
+        ts,
+        threshold,
+        _factorize_groups(ts.index, group_cols),
+        output_name=output_name,
     )
 
-    if not isinstance(out, pd.Series):  # pragma: no cover # emergency valve
-        raise AssertionError("How did we end up without a series?")  # noqa
-
-    output_name = _get_exceedance_prob_output_name(output_name, threshold)
-    out.name = output_name
-    out = _set_index_level_to(out, "unit", "dimensionless")
-
-    return out
-
 
 def calculate_exceedance_probabilities_over_time(
     scmrun, threshold, process_over_cols, output_name=None
@@ -343,12 +429,56 @@ def _set_peak_output_name(out, output_name, default_lead):
     else:
         idx = out.index.names
         out = out.reset_index()
-        out["variable"] = out["variable"].apply(lambda x: f"{default_lead} {x}")
+        out["variable"] = default_lead + " " + out["variable"].astype(str)
         out = out.set_index(idx)[0]
 
     return out
 
 
+def _peak_from_ts(ts, output_name=None):
+    out = ts.max(axis=1)
+
+    return _set_peak_output_name(out, output_name, "Peak")
+
+
+def _peak_time_from_ts(ts, output_name=None, return_year=True):
+    out = ts.idxmax(axis=1)
+    if return_year:
+        out = _extract_year(out)
+
+    return _set_peak_output_name(
+        out, output_name, "Year of peak" if return_year else "Time of peak"
+    )
+
+
+def _peak_and_peak_time_from_ts(ts, return_year=True):
+    """
+    Calculate the peak and the time of the peak in a single pass
+
+    One argmax over the values array yields both outputs, instead of separate
+    max and idxmax scans over the same matrix.
+    """
+    vals = ts.to_numpy()
+
+    # NaNs are skipped, matching DataFrame.max/idxmax
+    argmax = np.where(np.isnan(vals), -np.inf, vals).argmax(axis=1)
+
+    peaks = pd.Series(vals[np.arange(vals.shape[0]), argmax], index=ts.index)
+
+    peak_times = pd.Series(ts.columns[argmax], index=ts.index)
+    # the column labels carry the "time" name which idxmax would not
+    peak_times.name = None
+    if return_year:
+        peak_times = _extract_year(peak_times)
+
+    return (
+        _set_peak_output_name(peaks, None, "Peak"),
+        _set_peak_output_name(
+            peak_times, None, "Year of peak" if return_year else "Time of peak"
+        ),
+    )
+
+
 def calculate_peak(scmrun, output_name=None):
     """
     Calculate peak i.e. maximum of each timeseries
@@ -367,10 +497,14 @@ def calculate_peak(scmrun, output_name=None):
     :class:`pd.Series`
         Peak of each timeseries
     """
-    out = scmrun.timeseries().max(axis=1)
-    out = _set_peak_output_name(out, output_name, "Peak")
+    # reduce the raw values directly, only the output needs a pandas
+    # structure so there is no point building the intermediate DataFrame
+    out = pd.Series(
+        np.nanmax(scmrun.values, axis=1),
+        index=pd.MultiIndex.from_frame(scmrun.meta),
+    )
 
-    return out
+    return _set_peak_output_name(out, output_name, "Peak")
 
 
 def calculate_peak_time(scmrun, output_name=None, return_year=True):
@@ -394,16 +528,10 @@ def calculate_peak_time(scmrun, output_name=None, return_year=True):
     :class:`pd.Series`
         Peak of each timeseries
     """
-    out = scmrun.timeseries().idxmax(axis=1)
-    if return_year:
-        out = out.apply(lambda x: x.year)
-
-    out = _set_peak_output_name(
-        out, output_name, "Year of peak" if return_year else "Time of peak"
+    return _peak_time_from_ts(
+        scmrun.timeseries(), output_name, return_year=return_year
     )
 
-    return out
-
 
 def categorisation_sr15(scmrun, index):
     """
@@ -470,12 +598,20 @@ def categorisation_sr15(scmrun, index):
 
         return out
 
-    peak_median = _get_comp_series(calculate_peak(scmrun.filter(quantile=0.5)))
-    peak_p33 = _get_comp_series(calculate_peak(scmrun.filter(quantile=0.33)))
-    peak_p66 = _get_comp_series(calculate_peak(scmrun.filter(quantile=0.66)))
-    end_of_century_median = _get_comp_series(
-        calculate_peak(scmrun.filter(quantile=0.5, year=2100))
-    )
+    # materialise the timeseries once and slice it per quantile rather than
+    # re-filtering the full run for each of the comparison series
+    ts = scmrun.timeseries()
+    quantile_level = ts.index.get_level_values("quantile")
+
+    def _peak_for_quantile(quantile, ts=ts):
+        return _get_comp_series(_peak_from_ts(ts[quantile_level == quantile]))
+
+    peak_median = _peak_for_quantile(0.5)
+    peak_p33 = _peak_for_quantile(0.33)
+    peak_p66 = _peak_for_quantile(0.66)
+
+    in_2100 = np.array([c.year for c in ts.columns]) == 2100
+    end_of_century_median = _peak_for_quantile(0.5, ts=ts.loc[:, in_2100])
 
     categories[peak_median > 2.0] = "Above 2C"
     categories[peak_median <= 1.5] = "Below 1.5C"
@@ -501,8 +637,19 @@ def categorisation_sr15(scmrun, index):
     return categories
 
 
-def _calculate_quantile_groupby(base, index, quantile):
-    return base.groupby(index).quantile(quantile)
+def _calculate_quantiles_groupby(base, index, quantiles):
+    """
+    Calculate a set of quantiles with a single groupby
+
+    Grouping once and slicing the result afterwards is much cheaper than
+    calling ``base.groupby(index).quantile(q)`` separately for each quantile
+    as the group enumeration is only performed once.
+    """
+    return base.groupby(index).quantile(list(quantiles))
+
+
+def _extract_quantile(grouped_quantiles, quantile):
+    return grouped_quantiles.xs(quantile, level=-1)
 
 
 def _raise_missing_variable_error(name, requested, scmrun):
@@ -607,21 +754,43 @@ def calculate_summary_stats(  # noqa: PLR0912, PLR0913, PLR0915
     if exceedance_probabilities_naming_base is None:
         exceedance_probabilities_naming_base = _DEFAULT_EXCEEDANCE_PROB_OUTPUT_BASE
 
-    scmrun_exceedance_prob = scmrun.filter(
-        variable=exceedance_probabilities_variable,
-        log_if_empty=False,
+    variable_values = scmrun["variable"].to_numpy()
+
+    def _filter_variable(name, requested):
+        # an exact variable name is a single scan over the variable column,
+        # much cheaper than a full meta filter; anything containing filter
+        # wildcards still goes through filter
+        if isinstance(requested, str) and "*" not in requested:
+            keep = np.flatnonzero(variable_values == requested)
+            if not len(keep):
+                _raise_missing_variable_error(name, requested, scmrun)
+
+            return scmrun._from_iloc(keep)
+
+        out = scmrun.filter(variable=requested, log_if_empty=False)
+        if out.empty:
+            _raise_missing_variable_error(name, requested, scmrun)
+
+        return out
+
+    scmrun_exceedance_prob = _filter_variable(
+        "exceedance_probabilities_variable", exceedance_probabilities_variable
     )
-    if scmrun_exceedance_prob.empty:
-        _raise_missing_variable_error(
-            "exceedance_probabilities_variable",
-            exceedance_probabilities_variable,
-            scmrun,
-        )
 
+    _assert_only_one_value(scmrun_exceedance_prob, "variable")
+    _assert_only_one_value(scmrun_exceedance_prob, "unit")
+
+    # materialise the timeseries once and share it across all thresholds
+    exceedance_prob_ts = scmrun_exceedance_prob.timeseries()
+    # factorise the grouping once, the codes are shared by all thresholds
+    exceedance_prob_grouping = _factorize_groups(
+        exceedance_prob_ts.index,
+        list(scmrun_exceedance_prob.get_meta_columns_except(process_over_cols)),
+    )
     exceedance_prob_calls = [
         (
-            calculate_exceedance_probabilities,
-            [scmrun_exceedance_prob, t, process_over_cols],
+            _exceedance_probabilities_from_ts,
+            [exceedance_prob_ts, t, exceedance_prob_grouping],
             {"output_name": exceedance_probabilities_naming_base.format(t)},
             exceedance_probabilities_naming_base.format(t),
         )
@@ -637,42 +806,40 @@ def calculate_summary_stats(  # noqa: PLR0912, PLR0913, PLR0915
         else:
             peak_time_naming_base = "{} peak time"
 
-    scmrun_peak = scmrun.filter(
-        variable=peak_variable,
-        log_if_empty=False,
-    )
-    if scmrun_peak.empty:
-        _raise_missing_variable_error("peak_variable", peak_variable, scmrun)
+    scmrun_peak = _filter_variable("peak_variable", peak_variable)
 
     # pre-calculate to avoid calculating multiple times
-    peaks = calculate_peak(scmrun_peak)
+    peak_ts = scmrun_peak.timeseries()
+    peaks, peak_times = _peak_and_peak_time_from_ts(
+        peak_ts, return_year=peak_return_year
+    )
+    peak_quantile_res = _calculate_quantiles_groupby(peaks, _index, peak_quantiles)
     peak_calls = [
         (
-            _calculate_quantile_groupby,
-            [peaks, _index, q],
+            _extract_quantile,
+            [peak_quantile_res, q],
             {},
             peak_naming_base.format(q),
         )
         for q in peak_quantiles
     ]
 
-    # pre-calculate to avoid calculating multiple times
-    peak_times = calculate_peak_time(scmrun_peak, return_year=peak_return_year)
+    peak_time_quantile_res = _calculate_quantiles_groupby(
+        peak_times, _index, peak_quantiles
+    )
     peak_time_calls = [
         (
-            _calculate_quantile_groupby,
-            [peak_times, _index, q],
+            _extract_quantile,
+            [peak_time_quantile_res, q],
             {},
             peak_time_naming_base.format(q),
         )
         for q in peak_quantiles
     ]
 
-    scmrun_categorisation = scmrun.filter(variable=categorisation_variable)
-    if scmrun_categorisation.empty:
-        _raise_missing_variable_error(
-            "categorisation_variable", categorisation_variable, scmrun
-        )
+    scmrun_categorisation = _filter_variable(
+        "categorisation_variable", categorisation_variable
+    )
 
     _categorisation_quantile_cols = categorisation_quantile_cols
     if isinstance(_categorisation_quantile_cols, str):
@@ -713,16 +880,29 @@ def calculate_summary_stats(  # noqa: PLR0912, PLR0913, PLR0915
         res = func(*args, **kwargs)
         res.name = name
 
-        return res
+        return res.reorder_levels(_index)
 
-    series = [
-        get_result(func, args, kwargs, name).reorder_levels(_index)
-        for func, args, kwargs, name in iterator
-    ]
+    try:
+        # the statistics are independent of each other so can be evaluated in
+        # parallel where joblib is available (threads suffice as the heavy
+        # lifting happens in numpy/pandas which release the GIL)
+        import joblib
+
+        series = joblib.Parallel(n_jobs=-1, prefer="threads")(
+            joblib.delayed(get_result)(func, args, kwargs, name)
+            for func, args, kwargs, name in iterator
+        )
+    except ImportError:
+        series = [
+            get_result(func, args, kwargs, name)
+            for func, args, kwargs, name in iterator
+        ]
     if not peak_return_year:
         series = [s.astype("object") for s in series]
 
-    out = pd.DataFrame(series).T
+    # a single concat aligns all the series against the union index in one
+    # pass instead of re-aligning per series in the DataFrame constructor
+    out = pd.concat(series, axis="columns")
 
     out.columns.name = "statistic"
     out = out.stack("statistic")
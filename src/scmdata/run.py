@@ -506,6 +506,10 @@ class BaseScmRun(OpsMixin):  # pylint: disable=too-many-public-methods
 
         self.metadata: MetadataType = metadata.copy() if metadata is not None else {}
 
+        # cache of pandas groupers used by scmdata.groupby.RunGroupBy, keyed
+        # by group columns and validated against the identity of self._meta
+        self._grouper_cache: dict[Any, Any] = {}
+
     def _init_timeseries(
         self,
         data: Any,
@@ -1321,6 +1325,30 @@ class BaseScmRun(OpsMixin):  # pylint: disable=too-many-public-methods
 
         return day_match(days, values)
 
+    def _from_iloc(self, positions: Iterable[int]) -> Self:
+        """
+        Select a subset of the timeseries by integer position.
+
+        This is a fast path used internally when the rows of interest are
+        already known, e.g. from a groupby, so no filtering or revalidation is
+        performed.
+
+        Parameters
+        ----------
+        positions
+            Integer positions of the timeseries to select
+
+        Returns
+        -------
+        :class:`ScmRun <scmdata.run.ScmRun>`
+            Object containing the selected subset of timeseries
+        """
+        ret = copy.copy(self)
+        ret._df = self._df.iloc[:, positions]
+        ret._meta = self._meta[positions]
+
+        return ret
+
     def head(self, *args: Any, **kwargs: Any) -> pd.DataFrame:
         """
         Return head of :func:`self.timeseries()`.
@@ -2520,6 +2548,50 @@ def _merge_metadata(metadata):
     return res
 
 
+def _fast_concat(runs: Sequence[GenericRun]) -> GenericRun:
+    """
+    Append runs of the same class in a single concat
+
+    This skips the per-run index relabelling and overlap bookkeeping performed
+    by :func:`run_append`, concatenating all the data and metadata in one pass.
+    If the concatenated metadata contains duplicates, the full
+    :func:`run_append` machinery is used instead so duplicate handling is
+    unchanged.
+
+    Parameters
+    ----------
+    runs
+        The runs to append. Must all be instances of the same
+        :class:`BaseScmRun <scmdata.run.BaseScmRun>` subclass.
+
+    Returns
+    -------
+    :class:`ScmRun <scmdata.run.ScmRun>`
+        Object containing the appended data
+    """
+    ret = copy.copy(runs[0])
+
+    df = pd.concat([r._df for r in runs], axis="columns", copy=False)
+    df.columns = pd.Index(range(df.shape[1]))
+
+    ret._df = df.sort_index()
+    ret._time_points = TimePoints(ret._df.index.values)
+    ret._df.index = ret._time_points.to_index()
+
+    ret._meta = pd.MultiIndex.from_frame(
+        pd.concat(
+            [r._meta.to_frame() for r in runs], copy=False, ignore_index=True
+        ).astype("category")
+    )
+
+    if ret._duplicated_meta():
+        return run_append(list(runs))
+
+    ret.metadata = _merge_metadata([r.metadata for r in runs])
+
+    return ret
+
+
 def run_append(  # noqa: PLR0912, PLR0915
     runs: Sequence[GenericRun | pd.DataFrame],
     inplace: bool = False,
@@ -160,7 +160,9 @@ class TimePoints:
         :class:`numpy.ndarray` of :obj:`int`
             Year of each time point
         """
-        return np.vectorize(getattr)(self._values.astype(object), "year")
+        # integer arithmetic on the datetime64 values is much faster than
+        # going via datetime objects
+        return self._values.astype("datetime64[Y]").astype(int) + 1970
 
     def months(self) -> np.ndarray:
         """
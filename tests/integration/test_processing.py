@@ -560,6 +560,31 @@ def test_exceedance_probabilities_multiple_res(
     pdt.assert_series_equal(res, exp)
 
 
+def test_exceedance_probabilities_nan_group(
+    test_processing_scm_df_multi_climate_model,
+):
+    start = test_processing_scm_df_multi_climate_model.copy()
+    start["scenario"] = np.array(
+        [np.nan if m == "z_model" else "a_scenario" for m in start["climate_model"]],
+        dtype=object,
+    )
+
+    res = scmdata.processing.calculate_exceedance_probabilities(
+        start,
+        process_over_cols=["ensemble_member"],
+        threshold=1.5,
+    )
+
+    # groups with NaN metadata are dropped, like groupby
+    exp = scmdata.processing.calculate_exceedance_probabilities(
+        start.filter(climate_model="a_model"),
+        process_over_cols=["ensemble_member"],
+        threshold=1.5,
+    )
+
+    pdt.assert_series_equal(res, exp)
+
+
 def test_exceedance_probabilities_multiple_grouping(
     test_processing_scm_df_multi_climate_model,
 ):
@@ -375,6 +375,13 @@ def test_database_save_weird_end(tdb, start_scmrun, ch):
     pd.testing.assert_frame_equal(tdb.available_data(), exp)
 
 
+@pytest.mark.parametrize("ch", "[?")
+def test_database_save_glob_wildcards_rejected(tdb, start_scmrun, ch):
+    start_scmrun["climate_model"] = ["cmodel" + ch, "other"]
+    with pytest.raises(ValueError, match="Metadata cannot contain"):
+        tdb.save(start_scmrun)
+
+
 @pytest.mark.parametrize("ch", "[?/")
 def test_database_save_weird_unsupported(tdb, start_scmrun, ch):
     weird_var_name = "variable" + ch
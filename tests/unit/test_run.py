@@ -971,6 +971,17 @@ def test_filter_by_regexp(scm_run):
     assert obs["scenario"].unique() == "a_scenario"
 
 
+def test_filter_by_regexp_inline_flags(scm_run):
+    obs = scm_run.filter(scenario="(?i)A_SCENARIO$", regexp=True)
+    assert obs["scenario"].unique() == "a_scenario"
+
+
+def test_filter_by_regexp_backreference(scm_run):
+    scm_run["extra"] = ["x|x", "x|y", "y|y"]
+    obs = scm_run.filter(extra=["other(.)", r"(\w+)\|\1"], regexp=True)
+    assert (obs["extra"].unique() == ["x|x", "y|y"]).all()
+
+
 @pytest.mark.parametrize(
     "regexp,exp_units",
     (